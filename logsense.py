@@ -2,104 +2,271 @@ import sys
 import re
 import json
 import csv
+import functools
+import io
+import itertools
+import locale
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from colorama import Fore, init as colorama_init
 import os
 
 colorama_init(autoreset=True)
 
+# Precompiled patterns used by _LogParser. The ASCII variant
+# takes the engine's faster character-class path and covers almost every
+# line; the Unicode one is only tried when it misses. No ^/$ anchors:
+# .match() anchors at the start, and lines are stripped with no newline,
+# so the greedy message group already runs to the end.
+_LINE_PATTERN = (
+    r"(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2},\d{3})\s+(\w+)\s+(\w+)\s+-\s+(.+)"
+)
+_LINE_RE = re.compile(_LINE_PATTERN, re.ASCII)
+_LINE_RE_UNICODE = re.compile(_LINE_PATTERN)
+
+# Files at least this large are parsed in parallel, one chunk per CPU
+_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+# Reports are written straight to disk through a large buffer
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Truthy if a line begins with a YYYY-MM-DD date, i.e. starts a new record.
+# A bound C method is cheaper per call than the equivalent Python function.
+_is_ts_start = re.compile(r"\d{4}-\d{2}-\d{2}").match
+
 
 class LogEntry:
+    __slots__ = ("timestamp", "level", "module", "message", "stacktrace", "_dict")
+
     def __init__(self, timestamp, level, module, message, stacktrace=None):
         self.timestamp = timestamp
         self.level = level
         self.module = module
         self.message = message
         self.stacktrace = stacktrace
+        self._dict = None
 
     def to_dict(self):
-        return {
-            "timestamp": self.timestamp,
-            "level": self.level,
-            "module": self.module,
-            "message": self.message,
-            "stacktrace": self.stacktrace,
-        }
+        # Built on first use and shared by every later summary/export
+        if self._dict is None:
+            self._dict = {
+                "timestamp": self.timestamp,
+                "level": self.level,
+                "module": self.module,
+                "message": self.message,
+                "stacktrace": self.stacktrace,
+            }
+        return self._dict
+
+
+class _LogParser:
+    """Incremental parser state for a contiguous run of log lines"""
+
+    def __init__(self):
+        self.level_counts = Counter()
+        self.module_counts = Counter()
+        self.errors = []
+        self.warnings = []
+        self.first_timestamp = None
+        self.last_timestamp = None
+        # Entry that following undated lines are attached to
+        self._in_entry = False
+        self._entry = None
+        self._stacktrace = []
+
+    def feed(self, lines):
+        """Parse lines, continuing from where the previous call left off"""
+        _match = _LINE_RE.match
+        _match_unicode = _LINE_RE_UNICODE.match
+        _ts_start = _is_ts_start
+        _intern = sys.intern
+        level_counts = self.level_counts
+        module_counts = self.module_counts
+        errors_append = self.errors.append
+        warnings_append = self.warnings.append
+        first_timestamp = self.first_timestamp
+        last_timestamp = self.last_timestamp
+        in_entry = self._in_entry
+        entry = self._entry
+        stacktrace = self._stacktrace
+
+        # Single forward pass: any line that doesn't start with a date belongs
+        # to the current entry. Only errors and warnings are kept as LogEntry
+        # objects; other levels just update the counters.
+        for raw in lines:
+            if in_entry:
+                if not _ts_start(raw):
+                    if entry is not None:
+                        stacktrace.append(raw.strip())
+                    continue
+                if entry is not None:
+                    entry.stacktrace = "\n".join(stacktrace) if stacktrace else None
+                    entry = None
+                in_entry = False
+
+            line = raw.strip()
+            # Cheap shape check so blank and continuation lines skip the regex
+            if len(line) < 23 or line[4] != "-" or line[7] != "-":
+                continue
+
+            # Match standard log format: YYYY-MM-DD HH:MM:SS,mmm LEVEL module - message
+            match = _match(line) or _match_unicode(line)
+
+            if match:
+                timestamp, level, module, message = match.groups()
+                # Levels and modules repeat on nearly every line, so share one copy
+                level = _intern(level)
+                module = _intern(module)
+                level_counts[level] += 1
+                module_counts[module] += 1
+                if first_timestamp is None:
+                    first_timestamp = timestamp
+                last_timestamp = timestamp
+                in_entry = True
+
+                if level == "ERROR" or level == "WARNING":
+                    entry = LogEntry(timestamp, level, module, message)
+                    if level == "ERROR":
+                        errors_append(entry)
+                    else:
+                        warnings_append(entry)
+                    stacktrace = []
+
+        self.first_timestamp = first_timestamp
+        self.last_timestamp = last_timestamp
+        self._in_entry = in_entry
+        self._entry = entry
+        self._stacktrace = stacktrace
+
+    def merge(self, other):
+        """Append the results of a parser that ran over the lines following ours.
+
+        other must have started on a dated line, which ends our open entry.
+        """
+        self.close()
+        self.level_counts.update(other.level_counts)
+        self.module_counts.update(other.module_counts)
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        if self.first_timestamp is None:
+            self.first_timestamp = other.first_timestamp
+        if other.last_timestamp is not None:
+            self.last_timestamp = other.last_timestamp
+        self._in_entry = other._in_entry
+        self._entry = other._entry
+        self._stacktrace = other._stacktrace
+
+    def close(self):
+        """Finish the open entry's stacktrace"""
+        if self._entry is not None:
+            stacktrace = self._stacktrace
+            self._entry.stacktrace = "\n".join(stacktrace) if stacktrace else None
+            self._entry = None
+        self._in_entry = False
+        self._stacktrace = []
+
+
+def _parse_chunk(path, start, end):
+    """Parse bytes [start, end) of path, which begin at a line start.
+
+    Returns the undated lines the chunk starts with, which continue the
+    previous chunk's last entry, and a _LogParser for everything from the
+    first dated line on (None if there is none).
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    # Decode like open(path, "r") would, including newline translation
+    lines = io.StringIO(data.decode(locale.getpreferredencoding(False)), newline=None)
+    leading = []
+    for raw in lines:
+        if _is_ts_start(raw):
+            parser = _LogParser()
+            parser.feed(itertools.chain((raw,), lines))
+            return leading, parser
+        leading.append(raw)
+    return leading, None
 
 
 class LogAnalyzer:
     def __init__(self, filename):
         self.filename = filename
-        self.entries = []
         self.parse_logs()
 
+    @property
+    def total_entries(self):
+        return self.level_counts.total()
+
     def parse_logs(self):
         """Parse log file and extract structured data"""
-        with open(self.filename, "r") as file:
-            lines = file.readlines()
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                i += 1
-                continue
+        workers = os.cpu_count() or 1
+        size = os.path.getsize(self.filename)
 
-            # Match standard log format: YYYY-MM-DD HH:MM:SS,mmm LEVEL module - message
-            match = re.match(
-                r"^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2},\d{3})\s+(\w+)\s+(\w+)\s+-\s+(.+)$",
-                line,
+        if workers > 1 and size >= _PARALLEL_MIN_BYTES:
+            parser = self._parse_parallel(size, workers)
+        else:
+            parser = _LogParser()
+            with open(self.filename, "r") as file:
+                parser.feed(file)
+        parser.close()
+
+        self.level_counts = parser.level_counts
+        self.module_counts = parser.module_counts
+        self.errors = parser.errors
+        self.warnings = parser.warnings
+        self.first_timestamp = parser.first_timestamp
+        self.last_timestamp = parser.last_timestamp
+
+    def _parse_parallel(self, size, workers):
+        """Parse the file in line-aligned byte ranges across worker processes"""
+        bounds = [0]
+        with open(self.filename, "rb") as f:
+            for k in range(1, workers):
+                pos = max(size * k // workers, bounds[-1])
+                if pos > 0:
+                    # Move to the start of the next line
+                    f.seek(pos - 1)
+                    f.readline()
+                    pos = f.tell()
+                bounds.append(pos)
+        bounds.append(size)
+
+        parser = _LogParser()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(
+                _parse_chunk, itertools.repeat(self.filename), bounds[:-1], bounds[1:]
             )
-
-            if match:
-                timestamp, level, module, message = match.groups()
-
-                # Check for stacktrace on following lines
-                stacktrace = []
-                j = i + 1
-                while j < len(lines) and not re.match(r"^\d{4}-\d{2}-\d{2}", lines[j]):
-                    stacktrace.append(lines[j].strip())
-                    j += 1
-
-                entry = LogEntry(
-                    timestamp=timestamp,
-                    level=level,
-                    module=module,
-                    message=message,
-                    stacktrace="\n".join(stacktrace) if stacktrace else None,
-                )
-                self.entries.append(entry)
-                i = j
-            else:
-                i += 1
+            # Merge in file order; a chunk's leading lines still belong to
+            # the entry left open by the chunks before it
+            for leading, chunk in chunks:
+                parser.feed(leading)
+                if chunk is not None:
+                    parser.merge(chunk)
+        return parser
 
     def get_summary(self):
         """Generate comprehensive summary statistics"""
-        level_counts = Counter(entry.level for entry in self.entries)
-        module_counts = Counter(entry.module for entry in self.entries)
-
-        # Get error details
-        errors = [e for e in self.entries if e.level == "ERROR"]
-        error_types = Counter(e.message.split(":")[0] for e in errors)
+        level_counts = self.level_counts
+        errors = self.errors
+        warnings = self.warnings
 
-        # Get warning details
-        warnings = [e for e in self.entries if e.level == "WARNING"]
+        error_types = Counter(e.message.partition(":")[0] for e in errors)
         warning_types = Counter(
-            e.message.split(":")[0] if ":" in e.message else e.message.split("-")[0]
-            for e in warnings
+            e.message.partition(":" if ":" in e.message else "-")[0] for e in warnings
         )
 
         # Time range
-        if self.entries:
-            first_entry = self.entries[0].timestamp
-            last_entry = self.entries[-1].timestamp
+        if self.first_timestamp is not None:
+            first_entry = self.first_timestamp
+            last_entry = self.last_timestamp
         else:
             first_entry = last_entry = "N/A"
 
         return {
-            "total_entries": len(self.entries),
+            "total_entries": self.total_entries,
             "level_counts": dict(level_counts),
-            "module_counts": dict(module_counts),
+            "module_counts": dict(self.module_counts),
             "error_count": level_counts["ERROR"],
             "warning_count": level_counts["WARNING"],
             "info_count": level_counts["INFO"],
@@ -115,7 +282,9 @@ def export_html(analyzer, output_file):
     """Export log analysis to HTML"""
     summary = analyzer.get_summary()
 
-    html = f"""<!DOCTYPE html>
+    with open(output_file, "w", buffering=_WRITE_BUFFER_SIZE) as f:
+        write = f.write
+        write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -262,21 +431,22 @@ def export_html(analyzer, output_file):
                 <th>Count</th>
                 <th>Percentage</th>
             </tr>
-"""
+""")
 
-    for level, count in sorted(
-        summary["level_counts"].items(), key=lambda x: x[1], reverse=True
-    ):
-        percentage = (count / summary["total_entries"]) * 100
-        html += f"""
+        inv_total = 100.0 / (summary["total_entries"] or 1)
+        for level, count in sorted(
+            summary["level_counts"].items(), key=lambda x: x[1], reverse=True
+        ):
+            percentage = count * inv_total
+            write(f"""
             <tr>
                 <td><span class="level {level}">{level}</span></td>
                 <td>{count}</td>
                 <td>{percentage:.1f}%</td>
             </tr>
-"""
+""")
 
-    html += """
+        write("""
         </table>
         
         <h2>Module Activity</h2>
@@ -285,19 +455,19 @@ def export_html(analyzer, output_file):
                 <th>Module</th>
                 <th>Count</th>
             </tr>
-"""
+""")
 
-    for module, count in sorted(
-        summary["module_counts"].items(), key=lambda x: x[1], reverse=True
-    ):
-        html += f"""
+        for module, count in sorted(
+            summary["module_counts"].items(), key=lambda x: x[1], reverse=True
+        ):
+            write(f"""
             <tr>
                 <td>{module}</td>
                 <td>{count}</td>
             </tr>
-"""
+""")
 
-    html += """
+        write("""
         </table>
         
         <h2>Top Error Types</h2>
@@ -306,17 +476,17 @@ def export_html(analyzer, output_file):
                 <th>Error Type</th>
                 <th>Occurrences</th>
             </tr>
-"""
+""")
 
-    for error_type, count in summary["error_types"].items():
-        html += f"""
+        for error_type, count in summary["error_types"].items():
+            write(f"""
             <tr>
                 <td>{error_type}</td>
                 <td>{count}</td>
             </tr>
-"""
+""")
 
-    html += """
+        write("""
         </table>
         
         <h2>All Errors</h2>
@@ -326,10 +496,10 @@ def export_html(analyzer, output_file):
                 <th>Module</th>
                 <th>Message</th>
             </tr>
-"""
+""")
 
-    for error in summary["errors"]:
-        html += f"""
+        for error in summary["errors"]:
+            write(f"""
             <tr class="error-row">
                 <td class="timestamp">{error["timestamp"]}</td>
                 <td>{error["module"]}</td>
@@ -338,9 +508,9 @@ def export_html(analyzer, output_file):
                     {f'<div class="stacktrace">{error["stacktrace"]}</div>' if error["stacktrace"] else ""}
                 </td>
             </tr>
-"""
+""")
 
-    html += """
+        write("""
         </table>
         
         <h2>All Warnings</h2>
@@ -350,26 +520,23 @@ def export_html(analyzer, output_file):
                 <th>Module</th>
                 <th>Message</th>
             </tr>
-"""
+""")
 
-    for warning in summary["warnings"]:
-        html += f"""
+        for warning in summary["warnings"]:
+            write(f"""
             <tr class="warning-row">
                 <td class="timestamp">{warning["timestamp"]}</td>
                 <td>{warning["module"]}</td>
                 <td>{warning["message"]}</td>
             </tr>
-"""
+""")
 
-    html += """
+        write("""
         </table>
     </div>
 </body>
 </html>
-"""
-
-    with open(output_file, "w") as f:
-        f.write(html)
+""")
 
     print_colored(f"✓ HTML report generated: {output_file}", Fore.GREEN)
 
@@ -378,7 +545,13 @@ def export_csv(analyzer, output_file):
     """Export log analysis to CSV"""
     summary = analyzer.get_summary()
 
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
+    with open(
+        output_file,
+        "w",
+        newline="",
+        encoding="utf-8",
+        buffering=_WRITE_BUFFER_SIZE,
+    ) as f:
         writer = csv.writer(f)
 
         # Summary section
@@ -393,10 +566,11 @@ def export_csv(analyzer, output_file):
         # Level distribution
         writer.writerow(["LEVEL DISTRIBUTION"])
         writer.writerow(["Level", "Count", "Percentage"])
+        inv_total = 100.0 / (summary["total_entries"] or 1)
         for level, count in sorted(
             summary["level_counts"].items(), key=lambda x: x[1], reverse=True
         ):
-            percentage = (count / summary["total_entries"]) * 100
+            percentage = count * inv_total
             writer.writerow([level, count, f"{percentage:.1f}%"])
         writer.writerow([])
 
@@ -442,26 +616,75 @@ def export_csv(analyzer, output_file):
 
 
 def export_json(analyzer, output_file):
-    """Export log analysis to JSON"""
+    """Export log analysis to JSON (uses orjson when installed)"""
     summary = analyzer.get_summary()
     summary["source_file"] = analyzer.filename
 
-    with open(output_file, "w") as f:
-        json.dump(summary, f, indent=2)
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        # json.dump encodes incrementally, so the buffer absorbs its many small writes
+        with open(output_file, "w", buffering=_WRITE_BUFFER_SIZE) as f:
+            json.dump(summary, f, indent=2)
 
     print_colored(f"✓ JSON report generated: {output_file}", Fore.GREEN)
 
 
+@functools.cache
+def _pdf_styles():
+    """Build the PDF title and table styles once (requires reportlab)"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        "CustomTitle",
+        parent=styles["Heading1"],
+        fontSize=24,
+        textColor=colors.HexColor("#2c3e50"),
+        spaceAfter=30,
+    )
+
+    # Shared by both tables; each adds its own font size and body background
+    base_cmds = (
+        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+    )
+    summary_table_style = TableStyle(
+        base_cmds
+        + (
+            ("FONTSIZE", (0, 0), (-1, 0), 12),
+            ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+        )
+    )
+    error_table_style = TableStyle(
+        base_cmds
+        + (
+            ("FONTSIZE", (0, 0), (-1, -1), 10),
+            ("BACKGROUND", (0, 1), (-1, -1), colors.lightcoral),
+        )
+    )
+    return styles, title_style, summary_table_style, error_table_style
+
+
 def export_pdf(analyzer, output_file):
     """Export log analysis to PDF (requires reportlab)"""
     try:
         from reportlab.lib.pagesizes import letter
-        from reportlab.lib import colors
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
         from reportlab.platypus import (
             SimpleDocTemplate,
             Table,
-            TableStyle,
             Paragraph,
             Spacer,
         )
@@ -474,16 +697,9 @@ def export_pdf(analyzer, output_file):
     summary = analyzer.get_summary()
     doc = SimpleDocTemplate(output_file, pagesize=letter)
     elements = []
-    styles = getSampleStyleSheet()
+    styles, title_style, summary_table_style, error_table_style = _pdf_styles()
 
     # Title
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24,
-        textColor=colors.HexColor("#2c3e50"),
-        spaceAfter=30,
-    )
     elements.append(Paragraph("Log Analysis Report", title_style))
     elements.append(Paragraph(f"<b>Source:</b> {analyzer.filename}", styles["Normal"]))
     elements.append(Spacer(1, 0.2 * inch))
@@ -499,20 +715,7 @@ def export_pdf(analyzer, output_file):
     ]
 
     summary_table = Table(summary_data, colWidths=[3 * inch, 2 * inch])
-    summary_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 12),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                ("GRID", (0, 0), (-1, -1), 1, colors.black),
-            ]
-        )
-    )
+    summary_table.setStyle(summary_table_style)
     elements.append(summary_table)
     elements.append(Spacer(1, 0.3 * inch))
 
@@ -524,20 +727,7 @@ def export_pdf(analyzer, output_file):
 
     if len(error_data) > 1:
         error_table = Table(error_data, colWidths=[4 * inch, 1 * inch])
-        error_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.lightcoral),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                ]
-            )
-        )
+        error_table.setStyle(error_table_style)
         elements.append(error_table)
 
     doc.build(elements)
@@ -617,7 +807,7 @@ def main():
 
     print_colored(f"📖 Analyzing log file: {filename}", Fore.CYAN)
     analyzer = LogAnalyzer(filename)
-    print_colored(f"✓ Parsed {len(analyzer.entries)} log entries", Fore.GREEN)
+    print_colored(f"✓ Parsed {analyzer.total_entries} log entries", Fore.GREEN)
 
     # Generate output filename
     base_name = os.path.splitext(filename)[0]